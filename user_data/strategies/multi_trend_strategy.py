@@ -5,10 +5,12 @@ Uses multiple trend detection methods to improve win rate
 
 import numpy as np
 import pandas as pd
+from cachetools import LRUCache
 from datetime import datetime, timedelta, timezone
 from pandas import DataFrame
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
+from freqtrade.enums import RunMode
 from freqtrade.strategy import (
     IStrategy,
     Trade,
@@ -19,10 +21,168 @@ from freqtrade.strategy import (
     CategoricalParameter,
 )
 
-import pandas_ta as ta
+import numexpr as ne
+import talib
+from numba import njit
 from technical import qtpylib
 
 
+def _nbytes(value) -> int:
+    """
+    Memory held by a cached indicator result, an array or a tuple of arrays
+    """
+    arrays = value if isinstance(value, tuple) else (value,)
+    return sum(array.nbytes for array in arrays)
+
+
+@njit(fastmath=True)
+def _supertrend_kernel(high, low, close, period, multiplier):
+    """
+    Supertrend line and direction (1 bullish, -1 bearish) in a single pass.
+    Matches pandas_ta.supertrend with a TA-Lib (Wilder) ATR; the first
+    `period` candles have no ATR, so the line is NaN and the direction 1.
+    """
+    n = len(close)
+    supertrend = np.full(n, np.nan)
+    direction = np.ones(n, dtype=np.int8)
+    if n <= period:
+        return supertrend, direction
+
+    # Seed ATR with the mean true range of the first `period` candles
+    atr = 0.0
+    for i in range(1, period + 1):
+        atr += max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    atr /= period
+    hl2 = (high[period] + low[period]) / 2
+    upper = hl2 + multiplier * atr
+    lower = hl2 - multiplier * atr
+    supertrend[period] = lower
+
+    for i in range(period + 1, n):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        atr = (atr * (period - 1) + tr) / period
+        hl2 = (high[i] + low[i]) / 2
+        band_upper = hl2 + multiplier * atr
+        band_lower = hl2 - multiplier * atr
+
+        if close[i] > upper:
+            direction[i] = 1
+        elif close[i] < lower:
+            direction[i] = -1
+        else:
+            # No breakout: keep direction and never loosen the active band
+            direction[i] = direction[i - 1]
+            if direction[i] > 0 and band_lower < lower:
+                band_lower = lower
+            if direction[i] < 0 and band_upper > upper:
+                band_upper = upper
+
+        upper = band_upper
+        lower = band_lower
+        supertrend[i] = lower if direction[i] > 0 else upper
+
+    return supertrend, direction
+
+
+@njit
+def _ema_step(prev, value, alpha):
+    """
+    Advance an EMA by one value, using the same update as TA-Lib
+    """
+    return prev + alpha * (value - prev)
+
+
+# Layout of the ADX smoothing state carried between candles
+_ADX_HIGH, _ADX_LOW, _ADX_CLOSE, _ADX_TR, _ADX_PLUS_DM, _ADX_MINUS_DM, _ADX_VALUE = range(7)
+
+
+@njit
+def _adx_smooth(state, high, low, close, period):
+    """
+    Advance the Wilder-smoothed TR, +DM and -DM in state by one candle.
+    Returns (+DI, -DI, DX); DX is NaN where TA-Lib leaves it undefined.
+    """
+    up = high - state[_ADX_HIGH]
+    down = state[_ADX_LOW] - low
+    tr = max(high - low, abs(high - state[_ADX_CLOSE]), abs(low - state[_ADX_CLOSE]))
+
+    state[_ADX_PLUS_DM] -= state[_ADX_PLUS_DM] / period
+    state[_ADX_MINUS_DM] -= state[_ADX_MINUS_DM] / period
+    if down > 0 and up < down:
+        state[_ADX_MINUS_DM] += down
+    elif up > 0 and up > down:
+        state[_ADX_PLUS_DM] += up
+    state[_ADX_TR] = state[_ADX_TR] - state[_ADX_TR] / period + tr
+    state[_ADX_HIGH] = high
+    state[_ADX_LOW] = low
+    state[_ADX_CLOSE] = close
+
+    if abs(state[_ADX_TR]) < 1e-8:
+        return 0.0, 0.0, np.nan
+    di_plus = 100.0 * state[_ADX_PLUS_DM] / state[_ADX_TR]
+    di_minus = 100.0 * state[_ADX_MINUS_DM] / state[_ADX_TR]
+    if abs(di_plus + di_minus) < 1e-8:
+        return di_plus, di_minus, np.nan
+    return di_plus, di_minus, 100.0 * abs(di_minus - di_plus) / (di_plus + di_minus)
+
+
+@njit
+def _adx_step(state, high, low, close, period):
+    """
+    Advance ADX, +DI and -DI by one candle, updating state in place
+    """
+    di_plus, di_minus, dx = _adx_smooth(state, high, low, close, period)
+    if not np.isnan(dx):
+        state[_ADX_VALUE] = (state[_ADX_VALUE] * (period - 1) + dx) / period
+    return state[_ADX_VALUE], di_plus, di_minus
+
+
+@njit
+def _adx_kernel(high, low, close, period):
+    """
+    ADX, +DI and -DI over the whole series, matching TA-Lib, plus the
+    smoothing state of the last candle for _adx_step. The state is only
+    meaningful once ADX is seeded, i.e. with at least 2 * period candles.
+    """
+    n = len(close)
+    adx = np.full(n, np.nan)
+    di_plus = np.full(n, np.nan)
+    di_minus = np.full(n, np.nan)
+    state = np.zeros(7)
+    if n < 2 * period:
+        return adx, di_plus, di_minus, state
+
+    # Seed TR/+DM/-DM with plain sums over the first period - 1 moves
+    state[_ADX_HIGH] = high[0]
+    state[_ADX_LOW] = low[0]
+    state[_ADX_CLOSE] = close[0]
+    for i in range(1, period):
+        up = high[i] - state[_ADX_HIGH]
+        down = state[_ADX_LOW] - low[i]
+        if down > 0 and up < down:
+            state[_ADX_MINUS_DM] += down
+        elif up > 0 and up > down:
+            state[_ADX_PLUS_DM] += up
+        state[_ADX_TR] += max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        state[_ADX_HIGH] = high[i]
+        state[_ADX_LOW] = low[i]
+        state[_ADX_CLOSE] = close[i]
+
+    # Seed ADX with the mean DX of the next period candles
+    dx_sum = 0.0
+    for i in range(period, 2 * period):
+        di_plus[i], di_minus[i], dx = _adx_smooth(state, high[i], low[i], close[i], period)
+        if not np.isnan(dx):
+            dx_sum += dx
+    state[_ADX_VALUE] = dx_sum / period
+    adx[2 * period - 1] = state[_ADX_VALUE]
+
+    for i in range(2 * period, n):
+        adx[i], di_plus[i], di_minus[i] = _adx_step(state, high[i], low[i], close[i], period)
+
+    return adx, di_plus, di_minus, state
+
+
 class MultiTrendStrategy(IStrategy):
     """
     Multi-Trend Strategy using multiple methods to determine trend direction:
@@ -137,218 +297,362 @@ class MultiTrendStrategy(IStrategy):
         },
     }
 
+    # With hyperopt --analyze-per-epoch, indicator results are cached by
+    # (indicator, parameters, pair, candle range), so epochs only recompute
+    # indicators whose parameters changed. Without that flag hyperopt calls
+    # populate_indicators() once per pair up front, so the cache stays off.
+    # The cache is bounded by the bytes of its arrays (512 MB) and lives in
+    # each worker: with -j > 1 every epoch runs on a fresh copy of the
+    # strategy and starts with an empty cache, so it only pays off with -j 1.
+    _cache_indicators: bool = False
+    _indicator_cache_bytes: int = 512 * 1024 * 1024
+
+    def _cached(self, name: str, params: tuple, dataframe: DataFrame, metadata: dict, compute: Callable):
+        """
+        Return the cached result of compute() for this indicator and candle range
+        """
+        if not self._cache_indicators or dataframe.empty:
+            return compute()
+        dates = dataframe["date"]
+        key = (name, params, metadata.get("pair"), len(dataframe), dates.iat[0], dates.iat[-1])
+        result = self._indicator_cache.get(key)
+        if result is None:
+            result = compute()
+            if _nbytes(result) <= self._indicator_cache.maxsize:
+                self._indicator_cache[key] = result
+        return result
+
+    # In live/dry-run mode only one candle is added per call, so EMA and ADX
+    # are extended from the previous call's state instead of recomputed
+    _stream_indicators: bool = False
+
+    def bot_start(self, **kwargs) -> None:
+        """
+        Enable the indicator cache in hyperopt with --analyze-per-epoch, and
+        incremental indicator updates when trading live or dry-run
+        """
+        self._cache_indicators = (
+            self.dp.runmode == RunMode.HYPEROPT and bool(self.config.get("analyze_per_epoch"))
+        )
+        self._indicator_cache = LRUCache(maxsize=self._indicator_cache_bytes, getsizeof=_nbytes)
+        self._stream_indicators = self.dp.runmode in (RunMode.LIVE, RunMode.DRY_RUN)
+        self._stream_state: dict = {}
+
+    def _streamed(
+        self, name: str, params: tuple, dataframe: DataFrame, metadata: dict,
+        full: Callable, step: Callable
+    ) -> tuple:
+        """
+        Extend the previous columns of this indicator by the newest candle.
+        Falls back to full() on cold start, after a gap or when the last
+        candle was replaced. full() returns (columns, state) - state None when
+        the result cannot be extended - and step(state) returns (values, state).
+        """
+        pair_state = self._stream_state.setdefault(metadata["pair"], {})
+        previous = pair_state.get((name, params))
+        dates = dataframe["date"]
+        keep = len(dataframe) - 1
+        if previous is not None and keep > 0 and previous[0] == dates.iat[-2] and len(previous[1][0]) >= keep:
+            _, columns, state = previous
+            values, state = step(state)
+            columns = tuple(
+                np.append(column[len(column) - keep:], value)
+                for column, value in zip(columns, values)
+            )
+        else:
+            columns, state = full()
+        if state is None:
+            pair_state.pop((name, params), None)
+        else:
+            pair_state[(name, params)] = (dates.iat[-1], columns, state)
+        return columns
+
+    def _ema(self, dataframe: DataFrame, metadata: dict, period: int) -> np.ndarray:
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+        if self._stream_indicators:
+            alpha = 2.0 / (period + 1)
+
+            def full():
+                ema = talib.EMA(close, timeperiod=period)
+                return (ema,), ema[-1] if len(ema) and not np.isnan(ema[-1]) else None
+
+            def step(prev):
+                ema = _ema_step(prev, close[-1], alpha)
+                return (ema,), ema
+
+            return self._streamed("ema", (period,), dataframe, metadata, full, step)[0]
+        return self._cached(
+            "ema", (period,), dataframe, metadata,
+            lambda: talib.EMA(close, timeperiod=period)
+        )
+
+    def _adx(self, dataframe: DataFrame, metadata: dict, period: int) -> tuple:
+        high = dataframe["high"].to_numpy(dtype=np.float64)
+        low = dataframe["low"].to_numpy(dtype=np.float64)
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+        if self._stream_indicators:
+            def full():
+                adx, di_plus, di_minus, state = _adx_kernel(high, low, close, period)
+                return (adx, di_plus, di_minus), state if len(close) >= 2 * period else None
+
+            def step(state):
+                state = state.copy()
+                return _adx_step(state, high[-1], low[-1], close[-1], period), state
+
+            return self._streamed("adx", (period,), dataframe, metadata, full, step)
+        return self._cached(
+            "adx", (period,), dataframe, metadata,
+            lambda: (
+                talib.ADX(high, low, close, timeperiod=period),
+                talib.PLUS_DI(high, low, close, timeperiod=period),
+                talib.MINUS_DI(high, low, close, timeperiod=period),
+            )
+        )
+
+    def _supertrend(self, dataframe: DataFrame, metadata: dict, period: int, multiplier: float) -> tuple:
+        high = dataframe["high"].to_numpy(dtype=np.float64)
+        low = dataframe["low"].to_numpy(dtype=np.float64)
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+        return self._cached(
+            "supertrend", (period, multiplier), dataframe, metadata,
+            lambda: _supertrend_kernel(high, low, close, period, float(multiplier))
+        )
+
+    def _macd(self, dataframe: DataFrame, metadata: dict, fast: int, slow: int, signal: int) -> tuple:
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+        return self._cached(
+            "macd", (fast, slow, signal), dataframe, metadata,
+            lambda: talib.MACD(close, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+        )
+
+    def _rsi(self, dataframe: DataFrame, metadata: dict, period: int) -> np.ndarray:
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+        return self._cached(
+            "rsi", (period,), dataframe, metadata,
+            lambda: talib.RSI(close, timeperiod=period)
+        )
+
+    def _bbands(self, dataframe: DataFrame, metadata: dict, period: int, std: float) -> tuple:
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+        return self._cached(
+            "bbands", (period, std), dataframe, metadata,
+            lambda: talib.BBANDS(close, timeperiod=period, nbdevup=std, nbdevdn=std)
+        )
+
+    def _volume_sma(self, dataframe: DataFrame, metadata: dict, period: int) -> np.ndarray:
+        volume = dataframe["volume"].to_numpy(dtype=np.float64)
+        return self._cached(
+            "volume_sma", (period,), dataframe, metadata,
+            lambda: talib.SMA(volume, timeperiod=period)
+        )
+
+    @staticmethod
+    def _column_block(columns: dict, dtype, index: pd.Index) -> DataFrame:
+        """
+        Pack equally long arrays into a DataFrame backed by a single 2D block
+        """
+        block = np.empty((len(index), len(columns)), dtype=dtype, order="F")
+        for i, values in enumerate(columns.values()):
+            block[:, i] = values
+        return DataFrame(block, index=index, columns=list(columns))
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
-        Calculate all technical indicators for trend detection
+        Calculate all technical indicators for trend detection.
+        Indicators are computed in float64 and stored as float32, since they
+        are only compared against each other, prices and thresholds. All new
+        columns are added in one concat, as one float32 and one int8 block.
         """
         
+        # Hyperopt parameters, read once per call
+        ema_fast_period = self.ema_fast_period.value
+        ema_slow_period = self.ema_slow_period.value
+        ema_trend_period = self.ema_trend_period.value
+        adx_period = self.adx_period.value
+        adx_threshold = self.adx_threshold.value
+        supertrend_period = self.supertrend_period.value
+        supertrend_multiplier = self.supertrend_multiplier.value
+        macd_fast = self.macd_fast.value
+        macd_slow = self.macd_slow.value
+        macd_signal_period = self.macd_signal.value
+        rsi_period = self.rsi_period.value
+        bb_period = self.bb_period.value
+        bb_std = self.bb_std.value
+        
+        indicators = {}
+        signals = {}
+        
         # 1. Moving Averages (EMA)
-        dataframe["ema_fast"] = ta.ema(dataframe["close"], length=self.ema_fast_period.value)
-        dataframe["ema_slow"] = ta.ema(dataframe["close"], length=self.ema_slow_period.value)
-        dataframe["ema_trend"] = ta.ema(dataframe["close"], length=self.ema_trend_period.value)
+        ema_fast = self._ema(dataframe, metadata, ema_fast_period)
+        ema_slow = self._ema(dataframe, metadata, ema_slow_period)
+        ema_trend = self._ema(dataframe, metadata, ema_trend_period)
+        indicators["ema_fast"] = ema_fast
+        indicators["ema_slow"] = ema_slow
+        indicators["ema_trend"] = ema_trend
         
         # 2. ADX - Average Directional Index (trend strength)
-        adx_data = ta.adx(
-            dataframe["high"],
-            dataframe["low"],
-            dataframe["close"],
-            length=self.adx_period.value
-        )
-        if adx_data is not None:
-            dataframe["adx"] = adx_data[f"ADX_{self.adx_period.value}"]
-            dataframe["di_plus"] = adx_data[f"DMP_{self.adx_period.value}"]
-            dataframe["di_minus"] = adx_data[f"DMN_{self.adx_period.value}"]
-        else:
-            dataframe["adx"] = 0
-            dataframe["di_plus"] = 0
-            dataframe["di_minus"] = 0
+        adx, di_plus, di_minus = self._adx(dataframe, metadata, adx_period)
+        indicators["adx"] = adx
+        indicators["di_plus"] = di_plus
+        indicators["di_minus"] = di_minus
         
         # 3. Supertrend
-        supertrend_data = ta.supertrend(
-            dataframe["high"],
-            dataframe["low"],
-            dataframe["close"],
-            length=self.supertrend_period.value,
-            multiplier=self.supertrend_multiplier.value
+        supertrend, supertrend_direction = self._supertrend(
+            dataframe, metadata, supertrend_period, supertrend_multiplier
         )
-        if supertrend_data is not None:
-            dataframe["supertrend"] = supertrend_data[f"SUPERT_{self.supertrend_period.value}_{self.supertrend_multiplier.value}"]
-            dataframe["supertrend_direction"] = supertrend_data[f"SUPERTd_{self.supertrend_period.value}_{self.supertrend_multiplier.value}"]
-        else:
-            dataframe["supertrend"] = dataframe["close"]
-            dataframe["supertrend_direction"] = 1
+        indicators["supertrend"] = supertrend
+        signals["supertrend_direction"] = supertrend_direction
         
         # 4. MACD
-        macd_data = ta.macd(
-            dataframe["close"],
-            fast=self.macd_fast.value,
-            slow=self.macd_slow.value,
-            signal=self.macd_signal.value
+        macd, macd_signal, macd_hist = self._macd(
+            dataframe, metadata, macd_fast, macd_slow, macd_signal_period
         )
-        if macd_data is not None:
-            dataframe["macd"] = macd_data[f"MACD_{self.macd_fast.value}_{self.macd_slow.value}_{self.macd_signal.value}"]
-            dataframe["macd_signal"] = macd_data[f"MACDs_{self.macd_fast.value}_{self.macd_slow.value}_{self.macd_signal.value}"]
-            dataframe["macd_hist"] = macd_data[f"MACDh_{self.macd_fast.value}_{self.macd_slow.value}_{self.macd_signal.value}"]
-        else:
-            dataframe["macd"] = 0
-            dataframe["macd_signal"] = 0
-            dataframe["macd_hist"] = 0
+        indicators["macd"] = macd
+        indicators["macd_signal"] = macd_signal
+        indicators["macd_hist"] = macd_hist
         
         # 5. RSI
-        dataframe["rsi"] = ta.rsi(dataframe["close"], length=self.rsi_period.value)
+        indicators["rsi"] = self._rsi(dataframe, metadata, rsi_period)
         
         # 6. Bollinger Bands
-        bb_data = ta.bbands(
-            dataframe["close"],
-            length=self.bb_period.value,
-            std=self.bb_std.value
+        bb_upper, bb_middle, bb_lower = self._bbands(
+            dataframe, metadata, bb_period, bb_std
         )
-        if bb_data is not None:
-            dataframe["bb_upper"] = bb_data[f"BBU_{self.bb_period.value}_{self.bb_std.value}"]
-            dataframe["bb_middle"] = bb_data[f"BBM_{self.bb_period.value}_{self.bb_std.value}"]
-            dataframe["bb_lower"] = bb_data[f"BBL_{self.bb_period.value}_{self.bb_std.value}"]
-            dataframe["bb_width"] = (dataframe["bb_upper"] - dataframe["bb_lower"]) / dataframe["bb_middle"]
-        else:
-            dataframe["bb_upper"] = dataframe["close"] * 1.02
-            dataframe["bb_middle"] = dataframe["close"]
-            dataframe["bb_lower"] = dataframe["close"] * 0.98
-            dataframe["bb_width"] = 0.04
+        indicators["bb_upper"] = bb_upper
+        indicators["bb_middle"] = bb_middle
+        indicators["bb_lower"] = bb_lower
         
         # 7. Volume indicators
-        dataframe["volume_sma"] = ta.sma(dataframe["volume"], length=20)
+        volume_sma = self._volume_sma(dataframe, metadata, 20)
+        indicators["volume_sma"] = volume_sma
         
-        # Calculate individual trend signals
-        dataframe["trend_ema"] = np.where(
-            (dataframe["ema_fast"] > dataframe["ema_slow"]) & 
-            (dataframe["close"] > dataframe["ema_trend"]),
-            1,  # Bullish
-            np.where(
-                (dataframe["ema_fast"] < dataframe["ema_slow"]) & 
-                (dataframe["close"] < dataframe["ema_trend"]),
-                -1,  # Bearish
-                0  # Neutral
-            )
-        )
+        # Volume confirmations shared by both entry and both exit conditions
+        volume = dataframe["volume"].to_numpy(dtype=np.float64)
+        signals["vol_ok_entry"] = (volume > volume_sma).view(np.int8)
+        signals["vol_ok_exit"] = (volume > volume_sma * 0.8).view(np.int8)
         
-        dataframe["trend_adx"] = np.where(
-            (dataframe["adx"] > self.adx_threshold.value) & 
-            (dataframe["di_plus"] > dataframe["di_minus"]),
-            1,  # Bullish with strong trend
-            np.where(
-                (dataframe["adx"] > self.adx_threshold.value) & 
-                (dataframe["di_plus"] < dataframe["di_minus"]),
-                -1,  # Bearish with strong trend
-                0  # Weak trend
-            )
-        )
+        # Calculate individual trend signals as int8: 1 bullish, -1 bearish, 0 neutral
+        close = dataframe["close"].to_numpy(dtype=np.float64)
         
-        dataframe["trend_supertrend"] = np.where(
-            dataframe["supertrend_direction"] == 1,
-            1,  # Bullish
-            -1  # Bearish
-        )
+        ema_bull = (ema_fast > ema_slow) & (close > ema_trend)
+        ema_bear = (ema_fast < ema_slow) & (close < ema_trend)
+        trend_ema = ema_bull.view(np.int8) - ema_bear.view(np.int8)
+        signals["trend_ema"] = trend_ema
         
-        dataframe["trend_macd"] = np.where(
-            (dataframe["macd"] > dataframe["macd_signal"]) & 
-            (dataframe["macd_hist"] > 0),
-            1,  # Bullish
-            np.where(
-                (dataframe["macd"] < dataframe["macd_signal"]) & 
-                (dataframe["macd_hist"] < 0),
-                -1,  # Bearish
-                0  # Neutral
-            )
-        )
+        # Bullish/bearish only with a strong trend
+        strong_trend = adx > adx_threshold
+        adx_bull = strong_trend & (di_plus > di_minus)
+        adx_bear = strong_trend & (di_plus < di_minus)
+        trend_adx = adx_bull.view(np.int8) - adx_bear.view(np.int8)
+        signals["trend_adx"] = trend_adx
+        
+        # The supertrend direction is already 1 (bullish) / -1 (bearish) int8
+        trend_supertrend = supertrend_direction
+        signals["trend_supertrend"] = trend_supertrend
+        
+        # macd_hist is macd - macd_signal, so its sign alone gives the MACD side
+        trend_macd = (macd_hist > 0).view(np.int8) - (macd_hist < 0).view(np.int8)
+        signals["trend_macd"] = trend_macd
+        
+        # Aggregate all trend indicators in one (4, N) int8 matrix
+        trends = np.stack([trend_ema, trend_adx, trend_supertrend, trend_macd])
         
         # Calculate trend score (sum of all trend indicators)
-        dataframe["trend_score"] = (
-            dataframe["trend_ema"] +
-            dataframe["trend_adx"] +
-            dataframe["trend_supertrend"] +
-            dataframe["trend_macd"]
-        )
+        signals["trend_score"] = trends.sum(axis=0, dtype=np.int8)
         
         # Trend strength (0-4, number of confirming indicators)
-        dataframe["trend_strength_long"] = (
-            (dataframe["trend_ema"] == 1).astype(int) +
-            (dataframe["trend_adx"] == 1).astype(int) +
-            (dataframe["trend_supertrend"] == 1).astype(int) +
-            (dataframe["trend_macd"] == 1).astype(int)
-        )
+        signals["trend_strength_long"] = (trends == 1).sum(axis=0, dtype=np.int8)
+        signals["trend_strength_short"] = (trends == -1).sum(axis=0, dtype=np.int8)
         
-        dataframe["trend_strength_short"] = (
-            (dataframe["trend_ema"] == -1).astype(int) +
-            (dataframe["trend_adx"] == -1).astype(int) +
-            (dataframe["trend_supertrend"] == -1).astype(int) +
-            (dataframe["trend_macd"] == -1).astype(int)
+        return pd.concat(
+            [
+                dataframe,
+                self._column_block(indicators, np.float32, dataframe.index),
+                self._column_block(signals, np.int8, dataframe.index),
+            ],
+            axis=1,
+            copy=False,
         )
-        
-        return dataframe
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Define entry conditions for long and short positions
         """
         
+        min_trend_confirmations = self.min_trend_confirmations.value
+        rsi_overbought = self.rsi_overbought.value
+        rsi_oversold = self.rsi_oversold.value
+        ema_trend_period = self.ema_trend_period.value
+        bb_period = self.bb_period.value
+        
+        # Both entries require price against ema_trend and the Bollinger Bands,
+        # which are NaN for their TA-Lib lookback, so no entry can fire there
+        warmup = min(max(ema_trend_period, bb_period) - 1, len(dataframe))
+        
+        # Each condition chain is evaluated by numexpr in a single fused pass,
+        # over zero-copy views of the columns in their stored dtypes
+        # (float64 prices, float32 indicators, int8 signals), minus the warmup
+        names = (
+            "close", "open", "vol_ok_entry", "bb_lower", "bb_upper",
+            "ema_trend", "rsi", "macd_hist", "trend_strength_long", "trend_strength_short",
+        )
+        columns = {name: dataframe[name].to_numpy()[warmup:] for name in names}
+        columns["min_trend_confirmations"] = min_trend_confirmations
+        columns["rsi_overbought"] = rsi_overbought
+        columns["rsi_oversold"] = rsi_oversold
+        
+        # With 4+ confirmations trend_ema must agree, and trend_ema already
+        # requires close above/below ema_trend, so that check is redundant
+        check_ema_trend = min_trend_confirmations < 4
+        
         # LONG ENTRY CONDITIONS
         # Require multiple confirmations for trend
-        dataframe.loc[
-            (
-                # Multiple trend confirmations
-                (dataframe["trend_strength_long"] >= self.min_trend_confirmations.value) &
-                
-                # RSI not overbought
-                (dataframe["rsi"] < self.rsi_overbought.value) &
-                (dataframe["rsi"] > self.rsi_oversold.value) &
-                
-                # Price action
-                (dataframe["close"] > dataframe["open"]) &  # Bullish candle
-                
-                # Volume confirmation
-                (dataframe["volume"] > dataframe["volume_sma"]) &
-                
-                # Bollinger Bands - not overextended
-                (dataframe["close"] > dataframe["bb_lower"]) &
-                (dataframe["close"] < dataframe["bb_upper"]) &
-                
-                # Additional confirmation: price above EMA trend
-                (dataframe["close"] > dataframe["ema_trend"]) &
-                
-                # MACD momentum
-                (dataframe["macd_hist"] > 0)
-            ),
-            "enter_long",
-        ] = 1
+        long_conditions = (
+            # Multiple trend confirmations
+            "(trend_strength_long >= min_trend_confirmations)"
+            # RSI not overbought
+            " & (rsi < rsi_overbought) & (rsi > rsi_oversold)"
+            # Price action: bullish candle
+            " & (close > open)"
+            # Volume confirmation
+            " & (vol_ok_entry == 1)"
+            # Bollinger Bands - not overextended
+            " & (close > bb_lower) & (close < bb_upper)"
+            # MACD momentum
+            " & (macd_hist > 0)"
+        )
+        if check_ema_trend:
+            # Additional confirmation: price above EMA trend
+            long_conditions += " & (close > ema_trend)"
+        long_mask = ne.evaluate(long_conditions, local_dict=columns)
+        # Signal columns are int8 0/1, written in one assignment
+        enter_long = np.zeros(len(dataframe), dtype=np.int8)
+        enter_long[warmup:] = long_mask
+        dataframe["enter_long"] = enter_long
 
         # SHORT ENTRY CONDITIONS
         # Require multiple confirmations for trend
-        dataframe.loc[
-            (
-                # Multiple trend confirmations
-                (dataframe["trend_strength_short"] >= self.min_trend_confirmations.value) &
-                
-                # RSI not oversold
-                (dataframe["rsi"] > self.rsi_oversold.value) &
-                (dataframe["rsi"] < self.rsi_overbought.value) &
-                
-                # Price action
-                (dataframe["close"] < dataframe["open"]) &  # Bearish candle
-                
-                # Volume confirmation
-                (dataframe["volume"] > dataframe["volume_sma"]) &
-                
-                # Bollinger Bands - not overextended
-                (dataframe["close"] < dataframe["bb_upper"]) &
-                (dataframe["close"] > dataframe["bb_lower"]) &
-                
-                # Additional confirmation: price below EMA trend
-                (dataframe["close"] < dataframe["ema_trend"]) &
-                
-                # MACD momentum
-                (dataframe["macd_hist"] < 0)
-            ),
-            "enter_short",
-        ] = 1
+        short_conditions = (
+            # Multiple trend confirmations
+            "(trend_strength_short >= min_trend_confirmations)"
+            # RSI not oversold
+            " & (rsi > rsi_oversold) & (rsi < rsi_overbought)"
+            # Price action: bearish candle
+            " & (close < open)"
+            # Volume confirmation
+            " & (vol_ok_entry == 1)"
+            # Bollinger Bands - not overextended
+            " & (close < bb_upper) & (close > bb_lower)"
+            # MACD momentum
+            " & (macd_hist < 0)"
+        )
+        if check_ema_trend:
+            # Additional confirmation: price below EMA trend
+            short_conditions += " & (close < ema_trend)"
+        short_mask = ne.evaluate(short_conditions, local_dict=columns)
+        enter_short = np.zeros(len(dataframe), dtype=np.int8)
+        enter_short[warmup:] = short_mask
+        dataframe["enter_short"] = enter_short
 
         return dataframe
 
@@ -357,65 +661,76 @@ class MultiTrendStrategy(IStrategy):
         Define exit conditions for long and short positions
         """
         
+        rsi_overbought = self.rsi_overbought.value
+        rsi_oversold = self.rsi_oversold.value
+        
+        # Zero-copy views of the columns in their stored dtypes, unpacked by position
+        (
+            close, ema_fast, ema_slow, ema_trend, supertrend_direction,
+            macd, macd_signal, macd_hist, rsi, vol_ok_exit,
+        ) = (
+            dataframe[name].to_numpy()
+            for name in (
+                "close", "ema_fast", "ema_slow", "ema_trend", "supertrend_direction",
+                "macd", "macd_signal", "macd_hist", "rsi", "vol_ok_exit",
+            )
+        )
+        
         # EXIT LONG CONDITIONS
-        dataframe.loc[
+        exit_long = (
+            # Trend reversal signals
             (
-                # Trend reversal signals
+                # EMA crossover bearish
+                (ema_fast < ema_slow) |
+                
+                # Supertrend turns bearish
+                (supertrend_direction == -1) |
+                
+                # MACD bearish crossover
                 (
-                    # EMA crossover bearish
-                    (dataframe["ema_fast"] < dataframe["ema_slow"]) |
-                    
-                    # Supertrend turns bearish
-                    (dataframe["supertrend_direction"] == -1) |
-                    
-                    # MACD bearish crossover
-                    (
-                        (dataframe["macd"] < dataframe["macd_signal"]) &
-                        (dataframe["macd_hist"] < 0)
-                    ) |
-                    
-                    # RSI overbought
-                    (dataframe["rsi"] > self.rsi_overbought.value) |
-                    
-                    # Price breaks below trend EMA
-                    (dataframe["close"] < dataframe["ema_trend"])
-                ) &
+                    (macd < macd_signal) &
+                    (macd_hist < 0)
+                ) |
                 
-                # Confirm with volume
-                (dataframe["volume"] > dataframe["volume_sma"] * 0.8)
-            ),
-            "exit_long",
-        ] = 1
+                # RSI overbought
+                (rsi > rsi_overbought) |
+                
+                # Price breaks below trend EMA
+                (close < ema_trend)
+            ) &
+            
+            # Confirm with volume
+            (vol_ok_exit == 1)
+        )
+        dataframe["exit_long"] = exit_long.view(np.int8)
 
         # EXIT SHORT CONDITIONS
-        dataframe.loc[
+        exit_short = (
+            # Trend reversal signals
             (
-                # Trend reversal signals
+                # EMA crossover bullish
+                (ema_fast > ema_slow) |
+                
+                # Supertrend turns bullish
+                (supertrend_direction == 1) |
+                
+                # MACD bullish crossover
                 (
-                    # EMA crossover bullish
-                    (dataframe["ema_fast"] > dataframe["ema_slow"]) |
-                    
-                    # Supertrend turns bullish
-                    (dataframe["supertrend_direction"] == 1) |
-                    
-                    # MACD bullish crossover
-                    (
-                        (dataframe["macd"] > dataframe["macd_signal"]) &
-                        (dataframe["macd_hist"] > 0)
-                    ) |
-                    
-                    # RSI oversold
-                    (dataframe["rsi"] < self.rsi_oversold.value) |
-                    
-                    # Price breaks above trend EMA
-                    (dataframe["close"] > dataframe["ema_trend"])
-                ) &
+                    (macd > macd_signal) &
+                    (macd_hist > 0)
+                ) |
+                
+                # RSI oversold
+                (rsi < rsi_oversold) |
                 
-                # Confirm with volume
-                (dataframe["volume"] > dataframe["volume_sma"] * 0.8)
-            ),
-            "exit_short",
-        ] = 1
+                # Price breaks above trend EMA
+                (close > ema_trend)
+            ) &
+            
+            # Confirm with volume
+            (vol_ok_exit == 1)
+        )
+        dataframe["exit_short"] = exit_short.view(np.int8)
 
         return dataframe
 
@@ -440,15 +755,13 @@ class MultiTrendStrategy(IStrategy):
         if len(dataframe) < 1:
             return False
             
-        last_candle = dataframe.iloc[-1].squeeze()
+        min_trend_confirmations = self.min_trend_confirmations.value
         
         # Ensure we have strong trend confirmation
         if side == "long":
-            trend_val = last_candle.get("trend_strength_long", 0)
-            return isinstance(trend_val, (int, float)) and trend_val >= self.min_trend_confirmations.value
+            return bool(dataframe["trend_strength_long"].iat[-1] >= min_trend_confirmations)
         elif side == "short":
-            trend_val = last_candle.get("trend_strength_short", 0)
-            return isinstance(trend_val, (int, float)) and trend_val >= self.min_trend_confirmations.value
+            return bool(dataframe["trend_strength_short"].iat[-1] >= min_trend_confirmations)
             
         return True
 
@@ -471,17 +784,9 @@ class MultiTrendStrategy(IStrategy):
         if len(dataframe) < 1:
             return None
             
-        last_candle = dataframe.iloc[-1].squeeze()
-        
-        # Get trend strength for current position
-        if trade.is_short:
-            trend_strength = last_candle.get("trend_strength_short", 0)
-        else:
-            trend_strength = last_candle.get("trend_strength_long", 0)
-        
-        # Ensure trend_strength is numeric
-        if not isinstance(trend_strength, (int, float)):
-            return None
+        # Get trend strength for current position (int8, always numeric)
+        column = "trend_strength_short" if trade.is_short else "trend_strength_long"
+        trend_strength = dataframe[column].iat[-1]
         
         # Tighten stop if trend is weakening
         if trend_strength < 2:  # Less than 2 confirmations